@@ -3,11 +3,62 @@ AI Client Factory - Provides a unified interface for different AI providers.
 Supports OpenAI and Google Gemini with automatic fallback and provider selection.
 """
 
+import asyncio
+import copy
+import functools
+import hashlib
 import os
-from typing import Any, Dict, List, Optional, Tuple, Union
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from enum import Enum
 
 
+# LRU cache of insights keyed by (provider, model, prompt digest, temperature), holding (expiry, result).
+# Dashboards re-send identical prompts on every refresh, so a hit skips the whole LLM round-trip;
+# entries expire after _INSIGHTS_CACHE_TTL seconds so the provider is eventually asked again.
+_INSIGHTS_CACHE_MAXSIZE = 256
+_INSIGHTS_CACHE_TTL = 3600.0
+_insights_cache: "OrderedDict[Tuple[str, str, str, float], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_insights_cache_lock = threading.Lock()
+
+
+def _prompt_digest(prompt: str) -> str:
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Provider clients shared across AIClient instances, keyed by (provider, api key hash, model).
+# Reusing them keeps the SDK's HTTP/grpc connection pool warm instead of re-doing TLS per AIClient.
+_CLIENT_REGISTRY: Dict[Tuple[str, str, str], Any] = {}
+
+
+def _get_or_create_client(provider: str, client_cls: Any, api_key: str, model: Optional[str], force_mock: bool = False) -> Any:
+    """Return a shared provider client, constructing it on first use.
+
+    Only available clients are registered, so mocked clients and failed initialisations are never reused.
+    """
+    if force_mock:
+        return client_cls(api_key=api_key, model=model, force_mock=True)
+    key = (provider, hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:12], model or "")
+    client = _CLIENT_REGISTRY.get(key)
+    if client is None:
+        client = client_cls(api_key=api_key, model=model)
+        if client.is_available:
+            client = _CLIENT_REGISTRY.setdefault(key, client)
+    return client
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    """Return True if an exception (or anything it wraps) is an HTTP 429 from a provider SDK."""
+    while exc is not None:
+        if getattr(exc, "status_code", None) == 429 or getattr(exc, "code", None) == 429:
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
 class AIProvider(Enum):
     """Supported AI providers."""
     OPENAI = "openai"
@@ -21,6 +72,15 @@ class AIClient:
     Automatically selects the best available provider or allows manual selection.
     """
 
+    __slots__ = ("provider", "api_key", "model", "force_mock", "_client", "_provider_name")
+
+    # Provider -> name of the method that builds its client
+    _DISPATCH = {
+        AIProvider.AUTO: "_auto_select_provider",
+        AIProvider.OPENAI: "_init_openai",
+        AIProvider.GEMINI: "_init_gemini",
+    }
+
     def __init__(
         self, 
         provider: Union[AIProvider, str] = AIProvider.GEMINI,
@@ -39,14 +99,11 @@ class AIClient:
 
     def _initialize_client(self):
         """Initialize the appropriate AI client based on provider selection."""
-        if self.provider == AIProvider.AUTO:
-            self._client, self._provider_name = self._auto_select_provider()
-        elif self.provider == AIProvider.OPENAI:
-            self._client, self._provider_name = self._init_openai()
-        elif self.provider == AIProvider.GEMINI:
-            self._client, self._provider_name = self._init_gemini()
-        else:
+        try:
+            init = getattr(self, self._DISPATCH[self.provider])
+        except KeyError:
             raise ValueError(f"Unsupported provider: {self.provider}")
+        self._client, self._provider_name = init()
 
     def _auto_select_provider(self) -> Tuple[Any, str]:
         """Automatically select the best available provider based on API keys."""
@@ -55,7 +112,7 @@ class AIClient:
         if gemini_key and not self.force_mock:
             try:
                 from .gemini_client import GeminiClient
-                client = GeminiClient(api_key=gemini_key, model=self.model, force_mock=self.force_mock)
+                client = _get_or_create_client("gemini", GeminiClient, gemini_key, self.model, self.force_mock)
                 if client.is_available:
                     return client, "Gemini"
             except Exception:
@@ -66,7 +123,7 @@ class AIClient:
         if openai_key and not self.force_mock:
             try:
                 from .openai_client import OpenAIClient
-                client = OpenAIClient(api_key=openai_key, model=self.model, force_mock=self.force_mock)
+                client = _get_or_create_client("openai", OpenAIClient, openai_key, self.model, self.force_mock)
                 if client.is_available:
                     return client, "OpenAI"
             except Exception:
@@ -78,19 +135,96 @@ class AIClient:
     def _init_openai(self) -> Tuple[Any, str]:
         """Initialize OpenAI client."""
         from .openai_client import OpenAIClient
-        client = OpenAIClient(api_key=self.api_key, model=self.model, force_mock=self.force_mock)
+        api_key = (self.api_key or os.getenv("OPENAI_API_KEY") or "").strip()
+        client = _get_or_create_client("openai", OpenAIClient, api_key, self.model, self.force_mock)
         return client, "OpenAI"
 
     def _init_gemini(self) -> Tuple[Any, str]:
         """Initialize Gemini client."""
         from .gemini_client import GeminiClient
-        client = GeminiClient(api_key=self.api_key, model=self.model, force_mock=self.force_mock)
+        api_key = (self.api_key or os.getenv("GEMINI_API_KEY") or "").strip()
+        client = _get_or_create_client("gemini", GeminiClient, api_key, self.model, self.force_mock)
         return client, "Gemini"
 
     # --------------------------- Public API --------------------------- #
     def generate_business_insights(self, prompt: str, temperature: float = 0.2) -> Dict[str, Any]:
-        """Generate business insights using the configured provider."""
-        return self._client.generate_business_insights(prompt, temperature)
+        """Generate business insights using the configured provider.
+
+        Identical prompts are answered from an in-process LRU cache for up to
+        `_INSIGHTS_CACHE_TTL` seconds; see `cache_clear`.
+        """
+        key = (self._provider_name, getattr(self._client, "model", ""), _prompt_digest(prompt), temperature)
+        with _insights_cache_lock:
+            cached = _insights_cache.get(key)
+            if cached is not None:
+                expires_at, result = cached
+                if time.monotonic() < expires_at:
+                    _insights_cache.move_to_end(key)
+                    return copy.deepcopy(result)
+                del _insights_cache[key]
+
+        result = self._client.generate_business_insights(prompt, temperature)
+        with _insights_cache_lock:
+            _insights_cache[key] = (time.monotonic() + _INSIGHTS_CACHE_TTL, result)
+            _insights_cache.move_to_end(key)
+            if len(_insights_cache) > _INSIGHTS_CACHE_MAXSIZE:
+                _insights_cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop all cached insight responses."""
+        with _insights_cache_lock:
+            _insights_cache.clear()
+
+    def generate_business_insights_stream(self, prompt: str, temperature: float = 0.2) -> Iterator[Dict[str, Any]]:
+        """Stream insights, yielding a growing dict as each top-level key arrives (not cached)."""
+        return self._client.generate_business_insights_stream(prompt, temperature)
+
+    async def agenerate_business_insights(
+        self, prompt: str, temperature: float = 0.2, session: Any = None
+    ) -> Dict[str, Any]:
+        """Async variant of `generate_business_insights`; `session` comes from the provider's `async_session`."""
+        return await self._client.agenerate_business_insights(prompt, temperature, session)
+
+    async def agenerate_many(
+        self,
+        prompts: List[str],
+        concurrency: int = 8,
+        temperature: float = 0.2,
+        max_retries: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """Generate insights for many prompts concurrently, preserving input order.
+
+        At most `concurrency` requests are in flight at once. Requests rejected
+        with HTTP 429 are retried with jittered exponential backoff; the slot is
+        released while waiting so other prompts keep flowing. All requests share
+        one provider async session, closed once every prompt has finished.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(prompt: str, session: Any) -> Dict[str, Any]:
+            attempt = 0
+            while True:
+                try:
+                    async with semaphore:
+                        return await self.agenerate_business_insights(prompt, temperature, session)
+                except Exception as e:
+                    if attempt >= max_retries or not _is_rate_limited(e):
+                        raise
+                await asyncio.sleep(min(2 ** attempt, 30) + random.random())
+                attempt += 1
+
+        async with self._client.async_session() as session:
+            return list(await asyncio.gather(*(run(p, session) for p in prompts)))
+
+    def generate_many(self, prompts: List[str], concurrency: int = 8, temperature: float = 0.2) -> List[Dict[str, Any]]:
+        """Blocking wrapper around `agenerate_many`; use the async version inside a running event loop."""
+        return asyncio.run(self.agenerate_many(prompts, concurrency=concurrency, temperature=temperature))
+
+    def generate_business_insights_batch(self, prompts: List[str], temperature: float = 0.2) -> List[Dict[str, Any]]:
+        """Generate insights for several prompts with one provider request."""
+        return self._client.generate_business_insights_batch(prompts, temperature)
 
     def transcribe_audio(self, file_bytes: bytes, filename: str = "audio.wav") -> Tuple[str, bool]:
         """Transcribe audio using the configured provider."""
@@ -112,45 +246,37 @@ class AIClient:
             "is_available": self._client.is_available if hasattr(self._client, 'is_available') else False
         }
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _probe_providers() -> Tuple[bool, bool]:
+        """Return (openai_sdk_installed, gemini_sdk_installed); installed packages don't change at runtime."""
+        from .gemini_client import _sdk_installed as gemini_sdk_installed
+        from .openai_client import _sdk_installed as openai_sdk_installed
+        return openai_sdk_installed(), gemini_sdk_installed()
+
     @classmethod
     def get_available_providers(cls) -> List[Dict[str, Any]]:
-        """Get list of available providers and their status."""
-        providers = []
-        
-        # Check OpenAI
-        try:
-            from .openai_client import OpenAIClient
-            openai_client = OpenAIClient()
-            providers.append({
-                "name": "OpenAI",
-                "type": AIProvider.OPENAI.value,
-                "available": openai_client.is_available,
-                "status": openai_client.availability_status()
-            })
-        except Exception:
-            providers.append({
-                "name": "OpenAI",
-                "type": AIProvider.OPENAI.value,
-                "available": False,
-                "status": {"error": "Import failed"}
-            })
+        """Get list of available providers and their status.
 
-        # Check Gemini
-        try:
-            from .gemini_client import GeminiClient
-            gemini_client = GeminiClient()
-            providers.append({
-                "name": "Gemini",
-                "type": AIProvider.GEMINI.value,
-                "available": gemini_client.is_available,
-                "status": gemini_client.availability_status()
-            })
-        except Exception:
+        Only checks for an API key and an installed SDK; no provider client is constructed.
+        """
+        openai_sdk, gemini_sdk = cls._probe_providers()
+        providers = []
+        for name, provider, env_var, sdk_installed in (
+            ("OpenAI", AIProvider.OPENAI, "OPENAI_API_KEY", openai_sdk),
+            ("Gemini", AIProvider.GEMINI, "GEMINI_API_KEY", gemini_sdk),
+        ):
+            has_api_key = bool((os.getenv(env_var) or "").strip())
+            available = has_api_key and sdk_installed
             providers.append({
-                "name": "Gemini",
-                "type": AIProvider.GEMINI.value,
-                "available": False,
-                "status": {"error": "Import failed"}
+                "name": name,
+                "type": provider.value,
+                "available": available,
+                "status": {
+                    "has_api_key": has_api_key,
+                    "sdk_installed": sdk_installed,
+                    "using_mock": not available,
+                },
             })
 
         return providers
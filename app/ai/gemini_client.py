@@ -1,17 +1,88 @@
+import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib.util
 import json
 import os
-from typing import Any, Dict, List, Optional, Tuple
-import streamlit as st
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
+from . import transcript_cache
+from .prompts import build_batch_prompt
+from .streaming import iter_partial_objects
 
 try:
-    import google.generativeai as genai
-except Exception:  # pragma: no cover - optional dependency at runtime
-    genai = None  # type: ignore
+    import orjson
+    _json_loads = orjson.loads
+except Exception:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
 
 
 DEFAULT_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
 
+# Audio formats Gemini accepts as inline parts, by file extension.
+_AUDIO_MIME_TYPES = {
+    ".wav": "audio/wav",
+    ".mp3": "audio/mp3",
+    ".aiff": "audio/aiff",
+    ".aac": "audio/aac",
+    ".ogg": "audio/ogg",
+    ".flac": "audio/flac",
+}
+
+# google.generativeai drags in grpc/protobuf, so it is imported on first use only.
+_genai = None
+
+
+def _get_genai():
+    """Return the google.generativeai module, importing it on first call."""
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        _genai = genai
+    return _genai
+
+
+# genai.configure mutates SDK-global state and rebuilds its transport, so only call it when the key changes.
+_CONFIGURED_KEY: Optional[str] = None
+_configure_lock = threading.Lock()
+
+
+def _configure(api_key: str) -> None:
+    global _CONFIGURED_KEY
+    with _configure_lock:
+        if _CONFIGURED_KEY != api_key:
+            _get_genai().configure(api_key=api_key)
+            _CONFIGURED_KEY = api_key
+
+
+@functools.lru_cache(maxsize=4)
+def _generative_model(key_digest: str, model: str) -> Any:
+    """Shared GenerativeModel per (api key, model); the key digest only scopes the cache entry."""
+    return _get_genai().GenerativeModel(model)
+
+
+def _generation_config(temperature: float, **overrides: Any) -> Any:
+    """GenerationConfig for JSON insight replies; `overrides` replace or add individual fields."""
+    params: Dict[str, Any] = {
+        "temperature": temperature,
+        "top_p": 0.8,
+        "top_k": 40,
+        "max_output_tokens": 2048,
+        "response_mime_type": "application/json",
+    }
+    params.update(overrides)
+    return _get_genai().types.GenerationConfig(**params)
+
+
+def _sdk_installed() -> bool:
+    """Check whether google.generativeai is installed without importing it."""
+    try:
+        return importlib.util.find_spec("google.generativeai") is not None
+    except (ImportError, ValueError):  # parent package "google" missing
+        return False
+
 
 class GeminiClient:
     """Wrapper around Google Gemini SDK with robust fallbacks and JSON output parsing.
@@ -21,17 +92,20 @@ class GeminiClient:
     - Provides similar interface to OpenAIClient for easy switching.
     """
 
+    __slots__ = ("api_key", "model", "force_mock", "is_available", "_client")
+
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None, force_mock: bool = False) -> None:
         self.api_key = (api_key or os.getenv("GEMINI_API_KEY") or "").strip()
         self.model = model or DEFAULT_MODEL
         self.force_mock = force_mock
-        self.is_available = bool(self.api_key and genai and not self.force_mock)
+        self.is_available = bool(self.api_key and not self.force_mock and _sdk_installed())
         self._client = None
         
         if self.is_available:
             try:
-                genai.configure(api_key=self.api_key)
-                self._client = genai.GenerativeModel(self.model)
+                _configure(self.api_key)
+                key_digest = hashlib.sha1(self.api_key.encode("utf-8")).hexdigest()[:12]
+                self._client = _generative_model(key_digest, self.model)
             except Exception:
                 # Fallback to mock if initialization fails
                 self._client = None
@@ -53,22 +127,13 @@ class GeminiClient:
             raise RuntimeError("Gemini API is not available. Please check your API key and internet connection.")
 
         try:
-            # Configure generation parameters
-            generation_config = genai.types.GenerationConfig(
-                temperature=temperature,
-                top_p=0.8,
-                top_k=40,
-                max_output_tokens=2048,
-                response_mime_type="application/json"
-            )
-            
             response = self._client.generate_content(
                 prompt,
-                generation_config=generation_config
+                generation_config=_generation_config(temperature)
             )
             
-            content = response.text or "{}"
-            result = self._safe_json_loads(content, fallback={})
+            content = self._first_part_text(response)
+            result = self._safe_json_loads(content)
             
             if not result:
                 raise RuntimeError("Failed to generate valid insights from Gemini API.")
@@ -77,6 +142,82 @@ class GeminiClient:
         except Exception as e:
             raise RuntimeError(f"Gemini API error: {str(e)}")
 
+    async def agenerate_business_insights(
+        self, prompt: str, temperature: float = 0.2, session: Any = None
+    ) -> Dict[str, Any]:
+        """Async variant of `generate_business_insights`, run in a worker thread.
+
+        The SDK's `generate_content_async` goes through a process-wide grpc.aio
+        client bound to the first event loop that used it, so it fails once a
+        later `asyncio.run` (e.g. a second `AIClient.generate_many`) starts a new
+        loop. The sync grpc client is loop-independent, so `session` is unused.
+        """
+        if not self.is_available or not self._client:
+            raise RuntimeError("Gemini API is not available. Please check your API key and internet connection.")
+
+        return await asyncio.to_thread(self.generate_business_insights, prompt, temperature)
+
+    def generate_business_insights_stream(self, prompt: str, temperature: float = 0.2) -> Iterator[Dict[str, Any]]:
+        """Stream insights from Gemini, yielding a growing dict as each top-level key completes.
+
+        The last yielded dict holds every key returned by `generate_business_insights`.
+        """
+        if not self.is_available or not self._client:
+            raise RuntimeError("Gemini API is not available. Please check your API key and internet connection.")
+
+        try:
+            response = self._client.generate_content(
+                prompt,
+                generation_config=_generation_config(temperature),
+                stream=True
+            )
+
+            result: Dict[str, Any] = {}
+            for result in iter_partial_objects(self._iter_stream_text(response)):
+                yield result
+        except Exception as e:
+            raise RuntimeError(f"Gemini API error: {str(e)}") from e
+
+        if not result:
+            raise RuntimeError("Failed to generate valid insights from Gemini API.")
+
+    def generate_business_insights_batch(self, prompts: List[str], temperature: float = 0.2) -> List[Dict[str, Any]]:
+        """Answer several insight prompts with a single Gemini request.
+
+        Returns one insights dict per prompt, in the same order. A single prompt
+        goes through `generate_business_insights` so its request stays unchanged.
+        """
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self.generate_business_insights(prompts[0], temperature)]
+        if not self.is_available or not self._client:
+            raise RuntimeError("Gemini API is not available. Please check your API key and internet connection.")
+
+        try:
+            generation_config = _generation_config(
+                temperature, candidate_count=1, max_output_tokens=min(2048 * len(prompts), 8192)
+            )
+
+            response = self._client.generate_content(
+                build_batch_prompt(prompts),
+                generation_config=generation_config
+            )
+
+            content = self._first_part_text(response)
+            results = self._safe_json_loads(content).get("results")
+
+            if (
+                not isinstance(results, list)
+                or len(results) != len(prompts)
+                or not all(isinstance(r, dict) and r for r in results)
+            ):
+                raise RuntimeError("Failed to generate valid batched insights from Gemini API.")
+
+            return results
+        except Exception as e:
+            raise RuntimeError(f"Gemini API error: {str(e)}")
+
     def transcribe_audio(self, file_bytes: bytes, filename: str = "audio.wav") -> Tuple[str, bool]:
         """Transcribe audio via Gemini if available, else mock.
 
@@ -85,27 +226,30 @@ class GeminiClient:
         if not self.is_available or not self._client:
             return (self._mock_transcript(), False)
 
+        cached = transcript_cache.get_transcript("gemini", self.model, file_bytes)
+        if cached:
+            return (cached, True)
+
         try:
-            # For Gemini, we need to convert audio to text first
-            # This is a simplified implementation - in practice, you might need
-            # to use a different approach for audio transcription with Gemini
-            import base64
-            
-            # Convert audio bytes to base64
-            audio_base64 = base64.b64encode(file_bytes).decode('utf-8')
-            
             # Create a prompt for audio transcription
             audio_prompt = f"""
             Please transcribe the following audio file ({filename}) and provide a business summary.
             Focus on retail/shop insights, sales data, customer feedback, or operational observations.
             Keep the response concise and business-focused.
             """
-            
-            # Note: This is a simplified approach. For production, you might want to use
-            # a dedicated audio transcription service or Google Cloud Speech-to-Text
-            response = self._client.generate_content(audio_prompt)
-            transcript = response.text or self._mock_transcript()
-            
+
+            # Send the raw bytes as an inline audio part; Gemini decodes audio natively,
+            # so there is no base64 copy and no audio text in the prompt tokens
+            audio_part = {
+                "mime_type": _AUDIO_MIME_TYPES.get(os.path.splitext(filename)[1].lower(), "audio/wav"),
+                "data": file_bytes,
+            }
+            response = self._client.generate_content([audio_prompt, audio_part])
+            transcript = response.text
+            if not transcript:
+                return (self._mock_transcript(), False)
+
+            transcript_cache.set_transcript("gemini", self.model, file_bytes, transcript)
             return (transcript, True)
         except Exception:
             return (self._mock_transcript(), False)
@@ -114,15 +258,50 @@ class GeminiClient:
         """Return flags describing what's available for this client instance."""
         return {
             "has_api_key": bool(self.api_key),
-            "sdk_installed": bool(genai),
+            "sdk_installed": _sdk_installed(),
             "using_mock": not self.is_available,
         }
 
+    @contextlib.asynccontextmanager
+    async def async_session(self) -> AsyncIterator[None]:
+        """Counterpart of `OpenAIClient.async_session`; the shared sync model needs no per-loop client."""
+        yield None
+
     # --------------------------- Helpers --------------------------- #
     @staticmethod
-    def _safe_json_loads(text: str, fallback: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _mock_transcript() -> str:
+        return (
+            "Today's sales were steady. Milk and bread sold out by evening, and several "
+            "customers paid via UPI. Stock more dairy items ahead of the weekend."
+        )
+
+    @staticmethod
+    def _first_part_text(response: Any) -> str:
+        """Read the JSON text straight from the first candidate part.
+
+        `response.text` re-assembles every part and re-runs its safety checks on
+        each access; JSON-mode replies come back as a single text part.
+        """
         try:
-            return json.loads(text)
-        except Exception:
-            return fallback or {}
+            return response.candidates[0].content.parts[0].text
+        except (IndexError, AttributeError):
+            return ""
+
+    @staticmethod
+    def _iter_stream_text(response: Any) -> Iterator[str]:
+        for chunk in response:
+            try:
+                yield chunk.text
+            except ValueError:
+                # Chunks carrying only finish/safety metadata have no text parts.
+                continue
+
+    @staticmethod
+    def _safe_json_loads(text: Optional[str]) -> Dict[str, Any]:
+        if not text:
+            return {}
+        try:
+            return _json_loads(text)
+        except ValueError:  # json and orjson decode errors both subclass ValueError
+            return {}
 
@@ -1,15 +1,72 @@
+import contextlib
+import importlib.util
+import io
 import json
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
+from . import transcript_cache
+from .prompts import build_batch_prompt
+from .streaming import iter_partial_objects
 
 try:
-    from openai import OpenAI
-except Exception:  # pragma: no cover - optional dependency at runtime
-    OpenAI = None  # type: ignore
+    import orjson
+    _json_loads = orjson.loads
+except Exception:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
 
 
 DEFAULT_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+WHISPER_MODEL = "whisper-1"
+
+# The openai SDK pulls in httpx and pydantic models, so it is imported on first use only.
+_openai = None
+
+
+def _get_openai():
+    """Return the openai module, importing it on first call."""
+    global _openai
+    if _openai is None:
+        import openai
+        _openai = openai
+    return _openai
+
+
+def _sdk_installed() -> bool:
+    """Check whether the openai SDK is installed without importing it."""
+    try:
+        return importlib.util.find_spec("openai") is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _http_client(asynchronous: bool = False) -> Any:
+    """Build a pooled httpx client, multiplexing requests over HTTP/2 when h2 is installed."""
+    import httpx
+
+    http2 = importlib.util.find_spec("h2") is not None
+    limits = httpx.Limits(max_keepalive_connections=16)
+    timeout = httpx.Timeout(60.0, connect=10.0)
+    if asynchronous:
+        return httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(http2=http2, retries=2, limits=limits),
+            timeout=timeout,
+        )
+    return httpx.Client(
+        transport=httpx.HTTPTransport(http2=http2, retries=2, limits=limits),
+        timeout=timeout,
+    )
+
+
+SYSTEM_PROMPT = "You are a retail analytics assistant. Always reply with compact valid JSON."
+
+
+def _messages(prompt: str) -> List[Dict[str, str]]:
+    """Chat messages for an insights request: the JSON-only system prompt plus the user prompt."""
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
 
 
 class OpenAIClient:
@@ -20,15 +77,17 @@ class OpenAIClient:
     - Also supports Whisper transcription with graceful mock when unavailable.
     """
 
+    __slots__ = ("api_key", "model", "force_mock", "is_available", "_client")
+
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None, force_mock: bool = False) -> None:
         self.api_key = (api_key or os.getenv("OPENAI_API_KEY") or "").strip()
         self.model = model or DEFAULT_MODEL
         self.force_mock = force_mock
-        self.is_available = bool(self.api_key and OpenAI and not self.force_mock)
+        self.is_available = bool(self.api_key and not self.force_mock and _sdk_installed())
         self._client = None
         if self.is_available:
             try:
-                self._client = OpenAI(api_key=self.api_key)
+                self._client = _get_openai().OpenAI(api_key=self.api_key, http_client=_http_client())
             except Exception:
                 # Fallback to mock if initialization fails
                 self._client = None
@@ -54,13 +113,10 @@ class OpenAIClient:
                 model=self.model,
                 temperature=temperature,
                 response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": "You are a retail analytics assistant. Always reply with compact valid JSON."},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=_messages(prompt),
             )
-            content = response.choices[0].message.content or "{}"
-            result = self._safe_json_loads(content, fallback={})
+            content = response.choices[0].message.content
+            result = self._safe_json_loads(content)
             
             if not result:
                 raise RuntimeError("Failed to generate valid insights from OpenAI API.")
@@ -69,6 +125,97 @@ class OpenAIClient:
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {str(e)}")
 
+    async def agenerate_business_insights(
+        self, prompt: str, temperature: float = 0.2, session: Any = None
+    ) -> Dict[str, Any]:
+        """Async variant of `generate_business_insights` using an AsyncOpenAI client.
+
+        Pass the client yielded by `async_session` to share its connection pool
+        across calls; without one, a client is opened and closed for this call.
+        """
+        if not self.is_available or not self._client:
+            raise RuntimeError("OpenAI API is not available. Please check your API key and internet connection.")
+        if session is None:
+            async with self.async_session() as session:
+                return await self.agenerate_business_insights(prompt, temperature, session)
+
+        try:
+            response = await session.chat.completions.create(
+                model=self.model,
+                temperature=temperature,
+                response_format={"type": "json_object"},
+                messages=_messages(prompt),
+            )
+            content = response.choices[0].message.content
+            result = self._safe_json_loads(content)
+
+            if not result:
+                raise RuntimeError("Failed to generate valid insights from OpenAI API.")
+
+            return result
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}") from e
+
+    def generate_business_insights_stream(self, prompt: str, temperature: float = 0.2) -> Iterator[Dict[str, Any]]:
+        """Stream insights from OpenAI, yielding a growing dict as each top-level key completes.
+
+        The last yielded dict holds every key returned by `generate_business_insights`.
+        """
+        if not self.is_available or not self._client:
+            raise RuntimeError("OpenAI API is not available. Please check your API key and internet connection.")
+
+        try:
+            stream = self._client.chat.completions.create(
+                model=self.model,
+                temperature=temperature,
+                response_format={"type": "json_object"},
+                stream=True,
+                messages=_messages(prompt),
+            )
+            chunks = (chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices)
+            result: Dict[str, Any] = {}
+            for result in iter_partial_objects(chunks):
+                yield result
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}") from e
+
+        if not result:
+            raise RuntimeError("Failed to generate valid insights from OpenAI API.")
+
+    def generate_business_insights_batch(self, prompts: List[str], temperature: float = 0.2) -> List[Dict[str, Any]]:
+        """Answer several insight prompts with a single OpenAI request.
+
+        Returns one insights dict per prompt, in the same order. A single prompt
+        goes through `generate_business_insights` so its request stays unchanged.
+        """
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self.generate_business_insights(prompts[0], temperature)]
+        if not self.is_available or not self._client:
+            raise RuntimeError("OpenAI API is not available. Please check your API key and internet connection.")
+
+        try:
+            response = self._client.chat.completions.create(
+                model=self.model,
+                temperature=temperature,
+                response_format={"type": "json_object"},
+                messages=_messages(build_batch_prompt(prompts)),
+            )
+            content = response.choices[0].message.content
+            results = self._safe_json_loads(content).get("results")
+
+            if (
+                not isinstance(results, list)
+                or len(results) != len(prompts)
+                or not all(isinstance(r, dict) and r for r in results)
+            ):
+                raise RuntimeError("Failed to generate valid batched insights from OpenAI API.")
+
+            return results
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+
     def transcribe_audio(self, file_bytes: bytes, filename: str = "audio.wav") -> Tuple[str, bool]:
         """Transcribe audio via Whisper if available, else mock.
 
@@ -77,36 +224,72 @@ class OpenAIClient:
         if not self.is_available or not self._client:
             return (self._mock_transcript(), False)
 
-    def availability_status(self) -> Dict[str, bool]:
-        """Return flags describing what's available for this client instance."""
-        return {
-            "has_api_key": bool(self.api_key),
-            "sdk_installed": bool(OpenAI),
-            "using_mock": not self.is_available,
-        }
+        cached = transcript_cache.get_transcript("openai", WHISPER_MODEL, file_bytes)
+        if cached:
+            return (cached, True)
 
         try:
-            # The new OpenAI SDK uses the Audio namespace
+            # A named, seekable buffer lets httpx send a Content-Length instead of chunked encoding
+            audio_file = io.BytesIO(file_bytes)
+            audio_file.name = filename
+            # The new OpenAI SDK uses the Audio namespace; "text" skips the JSON wrapper
             transcript = self._client.audio.transcriptions.create(
-                model="whisper-1",
-                file=(filename, file_bytes),
+                model=WHISPER_MODEL,
+                file=audio_file,
+                response_format="text",
             )
-            # transcript.text for SDK >=1.0
-            text = getattr(transcript, "text", None) or getattr(transcript, "data", {}).get("text", "")  # type: ignore
+            if isinstance(transcript, str):
+                text = transcript.strip()
+            else:
+                # transcript.text for SDK >=1.0
+                text = getattr(transcript, "text", None) or getattr(transcript, "data", {}).get("text", "")  # type: ignore
             if not text:
                 text = self._mock_transcript()
                 return (text, False)
+            transcript_cache.set_transcript("openai", WHISPER_MODEL, file_bytes, text)
             return (text, True)
         except Exception:
             return (self._mock_transcript(), False)
 
+    def availability_status(self) -> Dict[str, bool]:
+        """Return flags describing what's available for this client instance."""
+        return {
+            "has_api_key": bool(self.api_key),
+            "sdk_installed": _sdk_installed(),
+            "using_mock": not self.is_available,
+        }
+
+    @contextlib.asynccontextmanager
+    async def async_session(self) -> AsyncIterator[Any]:
+        """Open an AsyncOpenAI client for a group of async calls and close it on exit.
+
+        httpx async connections belong to the event loop that opened them, so the
+        client is scoped to the caller (e.g. one `AIClient.agenerate_many`) instead
+        of being kept on this process-wide instance.
+        """
+        if not self.is_available:
+            yield None
+            return
+        aclient = _get_openai().AsyncOpenAI(api_key=self.api_key, http_client=_http_client(asynchronous=True))
+        async with aclient:
+            yield aclient
+
     # --------------------------- Helpers --------------------------- #
     @staticmethod
-    def _safe_json_loads(text: str, fallback: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _mock_transcript() -> str:
+        return (
+            "Today's sales were steady. Milk and bread sold out by evening, and several "
+            "customers paid via UPI. Stock more dairy items ahead of the weekend."
+        )
+
+    @staticmethod
+    def _safe_json_loads(text: Optional[str]) -> Dict[str, Any]:
+        if not text:
+            return {}
         try:
-            return json.loads(text)
-        except Exception:
-            return fallback or {}
+            return _json_loads(text)
+        except ValueError:  # json and orjson decode errors both subclass ValueError
+            return {}
 
 
 
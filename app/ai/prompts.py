@@ -1,9 +1,30 @@
-from typing import Dict
+from typing import Dict, List
+
+
+_SCHEMA_NOTE = (
+    "Return STRICT JSON with keys: executive_summary_en, executive_summary_hi, "
+    "recommendations (array of strings), recommendations_hi (array of Hindi strings), "
+    "kpi_commentary (object), kpi_commentary_hi (object with Hindi strings), "
+    "risks (array), opportunities (array)."
+)
+
+# Constant part of the insights prompt, materialised once at import time.
+_PREAMBLE = (
+    "You are an expert retail analyst helping small business owners. Analyze the following JSON data and provide actionable, concise insights. "
+    "Use an upbeat but professional tone for English. For all Hindi fields (executive_summary_hi, recommendations_hi, kpi_commentary_hi), use simple, everyday language that small shop owners can easily understand - avoid formal business terms, use common Hindi words, and write as if talking to a friend. "
+    + _SCHEMA_NOTE
+    + " In DATA, 'kpis' holds the headline numbers and 'columns' holds sample transactions column-wise: "
+    "each key maps to a list with one value per row, aligned by position."
+    + "\n\nDATA:\n"
+)
 
 
 def build_insights_prompt(data_json: str) -> str:
     """Return a compact instruction asking for strict JSON with insights.
 
+    `data_json` is the output of `build_json_for_ai`:
+    ``{"kpis": {...}, "columns": {"day": [...], "product": [...], ...}}``.
+
     The assistant must return a JSON object with keys:
     - executive_summary_en: string
     - executive_summary_hi: string
@@ -14,15 +35,19 @@ def build_insights_prompt(data_json: str) -> str:
     - risks: string[] (optional)
     - opportunities: string[] (optional)
     """
-    schema_note = (
-        "Return STRICT JSON with keys: executive_summary_en, executive_summary_hi, "
-        "recommendations (array of strings), recommendations_hi (array of Hindi strings), "
-        "kpi_commentary (object), kpi_commentary_hi (object with Hindi strings), "
-        "risks (array), opportunities (array)."
-    )
-    return (
-        f"You are an expert retail analyst helping small business owners. Analyze the following JSON data and provide actionable, concise insights. "
-        f"Use an upbeat but professional tone for English. For all Hindi fields (executive_summary_hi, recommendations_hi, kpi_commentary_hi), use simple, everyday language that small shop owners can easily understand - avoid formal business terms, use common Hindi words, and write as if talking to a friend. {schema_note}\n\nDATA:\n" + data_json
-    )
+    return _PREAMBLE + data_json
+
 
+def build_batch_prompt(prompts: List[str]) -> str:
+    """Combine several insight prompts into a single request.
 
+    Each sub-prompt is introduced by a ``### QUERY i`` delimiter (1-based). The
+    assistant must return a JSON object ``{"results": [...]}`` whose i-th element
+    is the insights object answering QUERY i+1, in the same order.
+    """
+    sections = [f"### QUERY {i}\n{prompt}" for i, prompt in enumerate(prompts, start=1)]
+    return (
+        f"You will receive {len(prompts)} independent queries, each introduced by a '### QUERY i' line. "
+        "Answer every query separately, following its own instructions. Return STRICT JSON of the form "
+        "{\"results\": [...]} with exactly one JSON object per query, in query order.\n\n" + "\n\n".join(sections)
+    )
@@ -0,0 +1,82 @@
+"""
+Incremental parsing of JSON objects streamed by an LLM.
+
+Lets callers surface each top-level field (e.g. executive_summary_en) as soon
+as the model has finished emitting it, instead of waiting for the whole reply.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+class TopLevelFieldParser:
+    """Bracket-counting parser that returns top-level object fields once they are complete.
+
+    Feed it arbitrary chunks of a single JSON object; each `feed` call returns
+    the fields whose values were closed by that chunk. Text before the opening
+    brace (and after the closing one) is ignored.
+    """
+
+    def __init__(self) -> None:
+        self._buf: List[str] = []
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {}
+        for ch in chunk:
+            if not self._started:
+                if ch == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+            if self._depth == 0:
+                break
+
+            if self._in_string:
+                self._buf.append(ch)
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+
+            if self._depth == 0 or (self._depth == 1 and ch == ","):
+                fields.update(self._flush())
+            else:
+                self._buf.append(ch)
+        return fields
+
+    def _flush(self) -> Dict[str, Any]:
+        member = "".join(self._buf).strip()
+        self._buf.clear()
+        if not member:
+            return {}
+        try:
+            return json.loads("{" + member + "}")
+        except ValueError:
+            return {}
+
+
+def iter_partial_objects(chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield a growing snapshot of the streamed object each time a top-level field completes."""
+    parser = TopLevelFieldParser()
+    result: Dict[str, Any] = {}
+    for chunk in chunks:
+        if not chunk:
+            continue
+        fields = parser.feed(chunk)
+        if fields:
+            result.update(fields)
+            yield dict(result)
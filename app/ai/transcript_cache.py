@@ -0,0 +1,63 @@
+"""
+Persistent cache for audio transcriptions, keyed by a hash of the audio bytes.
+
+Transcription is slow and billed per call but deterministic per file, so a
+re-uploaded recording is answered from disk, even after a restart.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Optional
+
+try:
+    from diskcache import Cache
+except Exception:  # pragma: no cover - optional dependency at runtime
+    Cache = None  # type: ignore
+
+
+CACHE_DIR = os.getenv("TRANSCRIPT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "bs_tx_cache"))
+SIZE_LIMIT = 512 << 20  # 512 MiB
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache():
+    """Open the on-disk cache on first use; None if diskcache is missing or the dir is unusable."""
+    global _cache
+    if _cache is None and Cache is not None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = Cache(CACHE_DIR, size_limit=SIZE_LIMIT)
+                except Exception:
+                    return None
+    return _cache
+
+
+def _key(provider: str, model: str, file_bytes: bytes) -> str:
+    return f"{provider}:{model}:{hashlib.blake2b(file_bytes, digest_size=16).hexdigest()}"
+
+
+def get_transcript(provider: str, model: str, file_bytes: bytes) -> Optional[str]:
+    """Return a cached transcript for these audio bytes, or None."""
+    cache = _get_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(_key(provider, model, file_bytes))
+    except Exception:
+        return None
+
+
+def set_transcript(provider: str, model: str, file_bytes: bytes, text: str) -> None:
+    """Store a transcript; failures are ignored since the cache is only an optimisation."""
+    cache = _get_cache()
+    if cache is None:
+        return
+    try:
+        cache.set(_key(provider, model, file_bytes), text)
+    except Exception:
+        pass
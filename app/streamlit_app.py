@@ -7,20 +7,23 @@ import io
 import os
 import sys
 import tempfile
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv, find_dotenv
 
-# Add the parent directory to the path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# `streamlit run app/streamlit_app.py` only puts app/ on sys.path; add the project root for `app.*` imports
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
-from app.ai.client_factory import AIClient, AIProvider
 from app.ai.prompts import build_insights_prompt
 from app.utils.data_utils import (
     build_json_for_ai,
+    compute_aggregates,
     compute_kpis,
+    concat_transactions,
     load_transactions_from_csv,
     make_pdf_report,
     normalize_transactions,
@@ -78,6 +81,9 @@ def initialize_session_state():
     if 'insights' not in st.session_state:
         st.session_state.insights = {}
     if 'ai_client' not in st.session_state:
+        # Imported here so reloads that already have a client skip the AI SDK import chain
+        from app.ai.client_factory import AIClient, AIProvider
+
         # Use Gemini as the default provider
         st.session_state.ai_client = AIClient(provider=AIProvider.GEMINI)
 
@@ -94,23 +100,58 @@ def load_sample_data(scenario: str) -> pd.DataFrame:
     
     file_path = sample_files.get(scenario)
     if file_path and os.path.exists(file_path):
-        df = pd.read_csv(file_path)
-        return normalize_transactions(df)
+        return _read_sample_csv(file_path, os.path.getmtime(file_path))
     return pd.DataFrame()
 
-def process_transactions(df: pd.DataFrame) -> Tuple[Dict, Dict]:
+@st.cache_data(show_spinner=False)
+def _read_sample_csv(file_path: str, mtime: float) -> pd.DataFrame:
+    # mtime is part of the cache key, so regenerated sample files are re-read
+    return normalize_transactions(pd.read_csv(file_path))
+
+def dataframe_hash(df: pd.DataFrame) -> int:
+    """Stable content fingerprint of a DataFrame, used as the cache key for derived results."""
+    return int(pd.util.hash_pandas_object(df, index=True).sum())
+
+# Cached wrappers: Streamlit reruns the whole script on every widget interaction,
+# so results derived from unchanged data are looked up by `df_hash` instead of recomputed.
+# The leading underscore keeps Streamlit from hashing the DataFrame argument itself.
+@st.cache_data(show_spinner=False)
+def _cached_aggregates(df_hash: int, _df: pd.DataFrame) -> Dict[str, Any]:
+    return compute_aggregates(_df)
+
+@st.cache_data(show_spinner=False)
+def _cached_top_products_chart(df_hash: int, _agg: Dict[str, Any]) -> bytes:
+    return plot_top_products_bar(_agg)
+
+@st.cache_data(show_spinner=False)
+def _cached_daily_revenue_chart(df_hash: int, _agg: Dict[str, Any]) -> bytes:
+    return plot_daily_revenue_line(_agg)
+
+@st.cache_data(show_spinner=False)
+def _cached_csv_bytes(df_hash: int, _df: pd.DataFrame) -> bytes:
+    return _df.to_csv(index=False).encode("utf-8")
+
+# The prompt is derived deterministically from the data, so it is the whole cache key.
+# Entries expire after an hour, the same TTL as AIClient's own insights cache, so a miss
+# here reaches the provider again; the sidebar's refresh button drops both caches early.
+@st.cache_data(ttl=3600, show_spinner="Generating AI insights...")
+def _cached_insights(prompt: str) -> Dict[str, Any]:
+    # Errors propagate, so a failed AI call is never cached
+    return st.session_state.ai_client.generate_business_insights(prompt)
+
+def process_transactions(df: pd.DataFrame, agg: Dict[str, Any]) -> Tuple[Dict, Dict]:
     """Process transactions and generate KPIs and insights."""
     if df.empty:
         return {}, {}
     
     # Compute KPIs
-    kpis = compute_kpis(df)
+    kpis = compute_kpis(agg)
     
     # Generate AI insights
     try:
         data_json = build_json_for_ai(df, kpis)
         prompt = build_insights_prompt(data_json)
-        insights = st.session_state.ai_client.generate_business_insights(prompt)
+        insights = _cached_insights(prompt)
     except Exception as e:
         st.error(f"❌ **AI Error:** {str(e)}")
         st.info("Please check your API key and internet connection, then try again.")
@@ -171,13 +212,13 @@ def render_sidebar():
                     if st.session_state.transactions_df.empty:
                         st.session_state.transactions_df = normalize_transactions(new_row)
                     else:
-                        st.session_state.transactions_df = pd.concat([
+                        st.session_state.transactions_df = concat_transactions([
                             st.session_state.transactions_df, 
                             normalize_transactions(new_row)
-                        ], ignore_index=True)
+                        ])
                     
+                    # No st.rerun(): the data buttons and dashboard below render after this in the same run
                     st.sidebar.success("✅ Transaction added!")
-                    st.rerun()
     
     elif data_source == "Sample Data":
         scenario = st.sidebar.selectbox(
@@ -193,6 +234,15 @@ def render_sidebar():
             else:
                 st.sidebar.error("❌ Sample data not found. Run scripts/generate_sample_data.py first.")
     
+    if not st.session_state.transactions_df.empty:
+        # Force fresh insights for the current data
+        if st.sidebar.button("🔄 Refresh AI Insights"):
+            from app.ai.client_factory import AIClient
+
+            _cached_insights.clear()
+            AIClient.cache_clear()
+        st.sidebar.caption("AI insights are reused for up to an hour per dataset.")
+
     # Clear data button
     if not st.session_state.transactions_df.empty:
         if st.sidebar.button("🗑️ Clear All Data"):
@@ -211,8 +261,10 @@ def render_main_content():
         return
     
     # Process data
+    df_hash = dataframe_hash(st.session_state.transactions_df)
+    agg = _cached_aggregates(df_hash, st.session_state.transactions_df)
     with st.spinner("Processing data and generating insights..."):
-        kpis, insights = process_transactions(st.session_state.transactions_df)
+        kpis, insights = process_transactions(st.session_state.transactions_df, agg)
         st.session_state.kpis = kpis
         st.session_state.insights = insights
     
@@ -254,15 +306,19 @@ def render_main_content():
     
     col1, col2 = st.columns(2)
     
+    # Drawn client-side from the aggregates; matplotlib is only used for the PDF
     with col1:
         st.subheader("Top Products by Revenue")
-        top_products_chart = plot_top_products_bar(st.session_state.transactions_df)
-        st.image(top_products_chart, use_column_width=True)
+        top_products = agg["prod_rev"].head(5)
+        # sort=False keeps the bars in revenue order instead of Vega-Lite's alphabetical default
+        st.bar_chart(
+            pd.Series(top_products.to_numpy(), index=top_products.index.astype(str), name="revenue"),
+            sort=False,
+        )
     
     with col2:
         st.subheader("Daily Revenue Trend")
-        daily_revenue_chart = plot_daily_revenue_line(st.session_state.transactions_df)
-        st.image(daily_revenue_chart, use_column_width=True)
+        st.line_chart(agg["day_rev"])
     
     # AI Insights Section
     st.header("🤖 AI-Powered Insights")
@@ -325,7 +381,7 @@ def render_main_content():
     # Data Table
     st.header("📋 Transaction Data")
     st.dataframe(
-        st.session_state.transactions_df.head(100),
+        st.session_state.transactions_df.iloc[:100],
         width="stretch",
         hide_index=True
     )
@@ -339,8 +395,8 @@ def render_main_content():
         if st.button("📊 Generate PDF Report", type="primary"):
             with st.spinner("Generating PDF report..."):
                 try:
-                    top_products_png = plot_top_products_bar(st.session_state.transactions_df)
-                    daily_rev_png = plot_daily_revenue_line(st.session_state.transactions_df)
+                    top_products_png = _cached_top_products_chart(df_hash, agg)
+                    daily_rev_png = _cached_daily_revenue_chart(df_hash, agg)
                     
                     pdf_bytes = make_pdf_report(
                         st.session_state.kpis,
@@ -361,7 +417,7 @@ def render_main_content():
     
     with col2:
         # CSV Export
-        csv_data = st.session_state.transactions_df.to_csv(index=False)
+        csv_data = _cached_csv_bytes(df_hash, st.session_state.transactions_df)
         st.download_button(
             label="📥 Download CSV Data",
             data=csv_data,
@@ -1,33 +1,95 @@
+import csv
+import functools
 import io
 import json
+import os
+import threading
+from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from pandas.api.types import union_categoricals
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except Exception:  # pragma: no cover - optional speedup
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
 
 
 REQUIRED_COLUMNS = ["date", "product", "quantity", "unit_price"]
 OPTIONAL_COLUMNS = ["category", "payment_method", "discount"]
+# Low-cardinality text columns stored as pandas categoricals so groupby works on integer codes
+CATEGORICAL_COLUMNS = ["product", "category", "payment_method"]
+# Headers normalize_transactions reads the transaction date from
+DATE_ALIASES = ["date", "order_date", "txn_date", "timestamp"]
+# Row count from which compute_aggregates sums categorical groups with the compiled kernel
+NUMBA_MIN_ROWS = 500_000
+CHART_DPI = 120
+
+# One long-lived figure per chart, created on first render and cleared between renders instead of rebuilt.
+# Each has its own lock, so the two charts can still render concurrently in worker threads.
+_FIGURES: Dict[str, Any] = {}
+_TOP_FIG_LOCK = threading.Lock()
+_DAILY_FIG_LOCK = threading.Lock()
+
+
+def _chart_figure(name: str, figsize: Tuple[float, float]) -> Any:
+    """Return the pooled figure for a chart; matplotlib is imported on first use. Call with the chart's lock held."""
+    fig = _FIGURES.get(name)
+    if fig is None:
+        import matplotlib
+        matplotlib.use("Agg")  # headless raster backend; the app never opens GUI windows
+        from matplotlib.figure import Figure
+
+        fig = _FIGURES[name] = Figure(figsize=figsize)
+    return fig
 
 
 def load_transactions_from_csv(file_bytes: bytes, encoding: str = "utf-8") -> pd.DataFrame:
     """Load transactions from CSV bytes with robust parsing.
 
     Accepts CSVs with flexible headers and attempts to normalize columns.
+    Set BUSSATHI_FAST_IO=1 to parse with PyArrow's multithreaded reader first.
     """
-    try:
-        df = pd.read_csv(io.BytesIO(file_bytes), encoding=encoding)
-    except Exception:
-        # Try without encoding hint or with excel dialects
+    df = _read_csv_arrow(file_bytes, encoding) if os.getenv("BUSSATHI_FAST_IO") == "1" else None
+    if df is None:
         try:
-            df = pd.read_csv(io.BytesIO(file_bytes))
-        except Exception as e:  # last resort
-            raise ValueError(f"Unable to read CSV: {e}")
+            df = pd.read_csv(io.BytesIO(file_bytes), encoding=encoding)
+        except Exception:
+            # Try without encoding hint or with excel dialects
+            try:
+                df = pd.read_csv(io.BytesIO(file_bytes))
+            except Exception as e:  # last resort
+                raise ValueError(f"Unable to read CSV: {e}")
     return normalize_transactions(df)
 
 
+def _read_csv_arrow(file_bytes: bytes, encoding: str = "utf-8") -> Optional[pd.DataFrame]:
+    """Parse CSV bytes with pyarrow.csv; None if pyarrow is missing or can't parse the file."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        # Date columns stay text so normalize_transactions parses them exactly as on the pandas path;
+        # pyarrow would otherwise convert offset timestamps to UTC and move them onto another day
+        header = next(csv.reader([file_bytes.split(b"\n", 1)[0].rstrip(b"\r").decode(encoding).lstrip("\ufeff")]), [])
+        date_columns = {name: pa.string() for name in header if _normalize_column_name(name) in DATE_ALIASES}
+        table = pacsv.read_csv(
+            pa.BufferReader(file_bytes),
+            read_options=pacsv.ReadOptions(encoding=encoding),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True, column_types=date_columns),
+        )
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    except Exception:
+        return None
+
+
 def normalize_transactions(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize common retail columns and ensure required columns exist.
 
@@ -40,11 +102,14 @@ def normalize_transactions(df: pd.DataFrame) -> pd.DataFrame:
     - category: [category, cat]
     - payment_method: [payment_method, payment, pay_method]
     """
-    df = df.copy()
-    df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
+    columns = [_normalize_column_name(c) for c in df.columns]
+    # Position of the first column with each normalized name, so the input frame is never copied or renamed
+    positions: Dict[str, int] = {}
+    for i, c in enumerate(columns):
+        positions.setdefault(c, i)
 
     alias_map = {
-        "date": ["date", "order_date", "txn_date", "timestamp"],
+        "date": DATE_ALIASES,
         "product": ["product", "sku", "item", "product_name"],
         "quantity": ["quantity", "qty", "units", "count"],
         "unit_price": ["unit_price", "price", "selling_price", "unitprice"],
@@ -53,127 +118,255 @@ def normalize_transactions(df: pd.DataFrame) -> pd.DataFrame:
         "payment_method": ["payment_method", "payment", "pay_method", "paymenttype"],
     }
 
-    def find_first(cols: List[str]) -> Optional[str]:
+    def find_first(cols: List[str]) -> Optional[int]:
         for c in cols:
-            if c in df.columns:
-                return c
+            if c in positions:
+                return positions[c]
         return None
 
-    mapped: Dict[str, Optional[str]] = {k: find_first(v) for k, v in alias_map.items()}
+    mapped: Dict[str, Optional[int]] = {k: find_first(v) for k, v in alias_map.items()}
 
-    # Create normalized columns
+    # Build every normalized column once, already coerced, then wrap them in a single frame
+    today = pd.Timestamp("today").normalize()
+    cols: Dict[str, Any] = {}
     for target in REQUIRED_COLUMNS + OPTIONAL_COLUMNS:
-        src = mapped.get(target)
-        if src and src in df.columns:
-            df[target] = df[src]
-        else:
-            # Fill sensible defaults
-            if target == "date":
-                df[target] = pd.Timestamp("today").normalize()
-            elif target == "product":
-                df[target] = df.get("product", "Unknown")
-            elif target == "quantity":
-                df[target] = 1
-            elif target == "unit_price":
-                df[target] = 0.0
-            elif target == "discount":
-                df[target] = 0.0
-            else:
-                df[target] = np.nan
-
-    # Coerce types
-    df["quantity"] = pd.to_numeric(df["quantity"], errors="coerce").fillna(0).astype(int)
-    df["unit_price"] = pd.to_numeric(df["unit_price"], errors="coerce").fillna(0.0)
-    df["discount"] = pd.to_numeric(df["discount"], errors="coerce").fillna(0.0)
-    df["product"] = df["product"].astype(str)
-    # Parse dates
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    df["date"] = df["date"].fillna(pd.Timestamp("today").normalize())
-
-    # Derived
-    df["revenue"] = (df["quantity"] * df["unit_price"]) - df["discount"].fillna(0.0)
-    df["day"] = df["date"].dt.date
-    return df[[
-        "date", "day", "product", "category", "quantity", "unit_price", "discount", "revenue", "payment_method"
-    ]]
-
-
-def compute_kpis(df: pd.DataFrame) -> Dict[str, Any]:
-    if df.empty:
-        return {
-            "total_revenue": 0.0,
-            "total_orders": 0,
-            "avg_order_value": 0.0,
-            "top_product": None,
-            "top_category": None,
-        }
-
-    total_revenue = float(df["revenue"].sum())
-    total_orders = int(len(df))
-    avg_order_value = float(total_revenue / total_orders) if total_orders else 0.0
+        pos = mapped[target]
+        if pos is not None:
+            cols[target] = df.iloc[:, pos]
+    n = len(df)
+    cols["date"] = pd.to_datetime(cols.get("date", pd.Series(pd.NaT, index=df.index)), errors="coerce").fillna(today)
+    cols["product"] = cols["product"].astype(str) if "product" in cols else pd.Series("Unknown", index=df.index)
+    cols["quantity"] = (
+        pd.to_numeric(cols["quantity"], errors="coerce").fillna(0).astype(int)
+        if "quantity" in cols else pd.Series(np.ones(n, dtype=int), index=df.index)
+    )
+    for target in ("unit_price", "discount"):
+        cols[target] = (
+            pd.to_numeric(cols[target], errors="coerce").fillna(0.0)
+            if target in cols else pd.Series(np.zeros(n), index=df.index)
+        )
+    for target in ("category", "payment_method"):
+        cols.setdefault(target, pd.Series(np.nan, index=df.index, dtype=object))
+
+    # Derived, on raw arrays to skip index alignment
+    cols["revenue"] = pd.Series(
+        cols["quantity"].to_numpy() * cols["unit_price"].to_numpy() - cols["discount"].to_numpy(),
+        index=df.index,
+    )
+    cols["day"] = cols["date"].dt.normalize()
+    for target in CATEGORICAL_COLUMNS:
+        cols[target] = _object_categorical(cols[target].astype("category"))
+    order = ["date", "day", "product", "category", "quantity", "unit_price", "discount", "revenue", "payment_method"]
+    return pd.DataFrame({c: cols[c] for c in order}, index=df.index, copy=False)
+
+
+def _normalize_column_name(name: Any) -> str:
+    return str(name).strip().lower().replace(" ", "_")
+
+
+def concat_transactions(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate normalized frames, keeping the categorical columns categorical.
+
+    pd.concat falls back to object dtype when the frames' categories differ, so
+    those columns are merged with union_categoricals instead. Categories are
+    unified as object dtype, since union_categoricals rejects e.g. float
+    categories (an empty CSV column) next to string ones (a manual entry).
+    """
+    cat_cols = [
+        c for c in CATEGORICAL_COLUMNS
+        if all(isinstance(f[c].dtype, pd.CategoricalDtype) for f in frames if c in f.columns)
+    ]
+    df = pd.concat([f.drop(columns=cat_cols, errors="ignore") for f in frames], ignore_index=True)
+    for c in cat_cols:
+        df[c] = union_categoricals([_object_categorical(f[c]) for f in frames], ignore_order=True)
+    return df[list(frames[0].columns)]
+
+
+def _object_categorical(col: pd.Series) -> pd.Series:
+    """Return a categorical column whose categories are object dtype (numeric CSV columns infer int/float)."""
+    categories = col.cat.categories
+    if categories.dtype == object:
+        return col
+    return col.cat.set_categories(categories.astype(object))
 
-    prod_rev = df.groupby("product")["revenue"].sum().sort_values(ascending=False)
-    cat_rev = df.groupby("category")["revenue"].sum().sort_values(ascending=False)
 
+def compute_aggregates(df: pd.DataFrame) -> Dict[str, Any]:
+    """Group the transactions once; KPIs and both charts are derived from the result.
+
+    Returns revenue by product and by category (descending), revenue by day
+    (chronological), total revenue and the order count.
+    """
+    return {
+        "prod_rev": _revenue_by(df, "product").sort_values(ascending=False),
+        "cat_rev": _revenue_by(df, "category").sort_values(ascending=False),
+        "day_rev": _revenue_by_day(df),
+        "total_revenue": float(df["revenue"].sum()),
+        "total_orders": int(len(df)),
+    }
+
+
+def _revenue_by_day(df: pd.DataFrame) -> pd.Series:
+    """Chronological revenue per day, via np.unique + np.bincount on day-resolution datetime64."""
+    day = df["day"]
+    if day.dt.tz is not None:
+        # numpy has no timezones and would truncate in UTC; keep the local wall-clock day
+        day = day.dt.tz_localize(None)
+    days, inverse = np.unique(day.to_numpy().astype("datetime64[D]"), return_inverse=True)
+    sums = np.bincount(inverse.ravel(), weights=df["revenue"].to_numpy(dtype=np.float64), minlength=len(days))
+    index = pd.DatetimeIndex(days.astype("datetime64[ns]"), name="day")
+    return pd.Series(sums.astype(np.float64, copy=False), index=index, name="revenue")
+
+
+def _revenue_by(df: pd.DataFrame, column: str) -> pd.Series:
+    """Revenue summed per value of a column; large categorical columns go through `_group_sum`."""
+    col = df[column]
+    if len(df) >= NUMBA_MIN_ROWS and isinstance(col.dtype, pd.CategoricalDtype):
+        group_sum = _group_sum()
+        if group_sum is not None:
+            cats = col.cat.categories
+            sums, counts = group_sum(col.cat.codes.to_numpy(), df["revenue"].to_numpy(dtype=np.float64), len(cats))
+            observed = counts > 0
+            index = pd.CategoricalIndex(cats[observed], categories=cats, name=column)
+            return pd.Series(sums[observed], index=index, name="revenue")
+    return df.groupby(column, observed=True)["revenue"].sum()
+
+
+@functools.lru_cache(maxsize=1)
+def _group_sum() -> Any:
+    """Compiled per-code sum kernel, or None without numba; numba is only imported for large frames."""
+    try:
+        from numba import njit
+    except Exception:  # pragma: no cover - optional speedup
+        return None
+
+    @njit(cache=True)
+    def group_sum(codes, values, n_groups):
+        # Sum values per categorical code in one pass; code -1 (missing) is skipped
+        sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        for i in range(codes.size):
+            c = codes[i]
+            if c >= 0:
+                sums[c] += values[i]
+                counts[c] += 1
+        return sums, counts
+
+    return group_sum
+
+
+def compute_kpis(agg: Dict[str, Any]) -> Dict[str, Any]:
+    """Headline KPIs from the output of `compute_aggregates`."""
+    prod_rev, cat_rev = agg["prod_rev"], agg["cat_rev"]
+    return _build_kpis(
+        agg["total_revenue"],
+        agg["total_orders"],
+        None if prod_rev.empty else str(prod_rev.index[0]),
+        None if cat_rev.empty else str(cat_rev.index[0]),
+    )
+
+
+def stream_kpis(
+    file_like: Union[str, IO], chunksize: int = 200_000
+) -> Iterator[Tuple[Dict[str, Any], pd.Series, pd.DataFrame]]:
+    """Read a CSV in chunks, yielding (running KPIs, running revenue by day, normalized chunk) after each one.
+
+    Only running totals are kept between chunks, so memory stays proportional to
+    `chunksize` rather than to the file. The KPIs match `compute_kpis` and the
+    chronological revenue by day matches `compute_aggregates(...)["day_rev"]`, so
+    `plot_daily_revenue_line({"day_rev": day_rev})` draws the trend without
+    concatenating chunks.
+    """
+    rev_total = 0.0
+    order_total = 0
+    prod_rev: Counter = Counter()
+    cat_rev: Counter = Counter()
+    day_rev = pd.Series(dtype=np.float64)
+
+    for ch in pd.read_csv(file_like, chunksize=chunksize):
+        ch = normalize_transactions(ch)
+        rev_total += float(ch["revenue"].sum())
+        order_total += len(ch)
+        prod_rev.update(ch.groupby("product", observed=True)["revenue"].sum().to_dict())
+        cat_rev.update(ch.groupby("category", observed=True)["revenue"].sum().to_dict())
+        day_rev = _revenue_by_day(ch) if day_rev.empty else day_rev.add(_revenue_by_day(ch), fill_value=0.0)
+
+        kpis = _build_kpis(
+            rev_total,
+            order_total,
+            prod_rev.most_common(1)[0][0] if prod_rev else None,
+            cat_rev.most_common(1)[0][0] if cat_rev else None,
+        )
+        yield kpis, day_rev, ch
+
+
+def _build_kpis(total_revenue: float, total_orders: int, top_product: Any, top_category: Any) -> Dict[str, Any]:
+    avg_order_value = float(total_revenue / total_orders) if total_orders else 0.0
     return {
         "total_revenue": round(total_revenue, 2),
         "total_orders": total_orders,
         "avg_order_value": round(avg_order_value, 2),
-        "top_product": None if prod_rev.empty else prod_rev.index[0],
-        "top_category": None if cat_rev.empty else (cat_rev.index[0] if str(cat_rev.index[0]) != "nan" else None),
+        "top_product": top_product,
+        "top_category": top_category if top_category is not None and str(top_category) != "nan" else None,
     }
 
 
-def plot_top_products_bar(df: pd.DataFrame, top_n: int = 5) -> bytes:
-    """Return PNG bytes of a matplotlib bar chart of top products by revenue."""
-    fig, ax = plt.subplots(figsize=(6, 4))
-    if df.empty:
-        ax.text(0.5, 0.5, "No data", ha="center", va="center")
-    else:
-        prod_rev = df.groupby("product")["revenue"].sum().sort_values(ascending=False).head(top_n)
-        ax.bar(prod_rev.index.astype(str), prod_rev.values, color="#2563eb")
-        ax.set_title("Top Products by Revenue")
-        ax.set_ylabel("Revenue")
-        ax.set_xlabel("Product")
-        ax.tick_params(axis='x', rotation=30)
-        ax.grid(axis="y", linestyle=":", alpha=0.4)
-    buf = io.BytesIO()
-    fig.tight_layout()
-    fig.savefig(buf, format="png", dpi=160)
-    plt.close(fig)
-    buf.seek(0)
+def plot_top_products_bar(agg: Dict[str, Any], top_n: int = 5) -> bytes:
+    """Return PNG bytes of a matplotlib bar chart of top products by revenue, from `compute_aggregates`."""
+    prod_rev = agg["prod_rev"].head(top_n)
+    with _TOP_FIG_LOCK:
+        fig = _chart_figure("top_products", (6, 4))
+        fig.clf()
+        ax = fig.add_subplot(111)
+        if prod_rev.empty:
+            ax.text(0.5, 0.5, "No data", ha="center", va="center")
+        else:
+            ax.bar(prod_rev.index.astype(str), prod_rev.values, color="#2563eb")
+            ax.set_title("Top Products by Revenue")
+            ax.set_ylabel("Revenue")
+            ax.set_xlabel("Product")
+            ax.tick_params(axis='x', rotation=30)
+            ax.grid(axis="y", linestyle=":", alpha=0.4)
+        buf = io.BytesIO()
+        fig.tight_layout()
+        fig.savefig(buf, format="png", dpi=CHART_DPI)
     return buf.getvalue()
 
 
-def plot_daily_revenue_line(df: pd.DataFrame) -> bytes:
-    """Return PNG bytes of a matplotlib line chart of revenue by day."""
-    fig, ax = plt.subplots(figsize=(6, 3.5))
-    if df.empty:
-        ax.text(0.5, 0.5, "No data", ha="center", va="center")
-    else:
-        day_rev = df.groupby("day")["revenue"].sum().sort_index()
-        ax.plot(list(day_rev.index), list(day_rev.values), marker="o", color="#16a34a")
-        ax.set_title("Revenue by Day")
-        ax.set_ylabel("Revenue")
-        ax.set_xlabel("Day")
-        ax.grid(True, linestyle=":", alpha=0.4)
-    buf = io.BytesIO()
-    fig.tight_layout()
-    fig.savefig(buf, format="png", dpi=160)
-    plt.close(fig)
-    buf.seek(0)
+def plot_daily_revenue_line(agg: Dict[str, Any]) -> bytes:
+    """Return PNG bytes of a matplotlib line chart of revenue by day, from `compute_aggregates`."""
+    day_rev = agg["day_rev"]
+    with _DAILY_FIG_LOCK:
+        fig = _chart_figure("daily_revenue", (6, 3.5))
+        fig.clf()
+        ax = fig.add_subplot(111)
+        if day_rev.empty:
+            ax.text(0.5, 0.5, "No data", ha="center", va="center")
+        else:
+            ax.plot(list(day_rev.index), list(day_rev.values), marker="o", color="#16a34a")
+            ax.set_title("Revenue by Day")
+            ax.set_ylabel("Revenue")
+            ax.set_xlabel("Day")
+            ax.grid(True, linestyle=":", alpha=0.4)
+        buf = io.BytesIO()
+        fig.tight_layout()
+        fig.savefig(buf, format="png", dpi=CHART_DPI)
     return buf.getvalue()
 
 
 def build_json_for_ai(df: pd.DataFrame, kpis: Dict[str, Any], max_rows: int = 50) -> str:
-    """Compact JSON payload for LLM containing KPIs and a small sample of rows."""
-    sample = df.head(max_rows)[["day", "product", "category", "quantity", "unit_price", "discount", "revenue"]].copy()
-    sample["day"] = sample["day"].astype(str)
+    """Compact JSON payload for LLM containing KPIs and a small sample of rows.
+
+    Rows are laid out column-wise, ``{"kpis": {...}, "columns": {"day": [...], ...}}``,
+    so field names are sent once instead of once per row.
+    """
+    sample = df.iloc[:max_rows]
+    columns = {c: sample[c].tolist() for c in ["product", "category", "quantity", "unit_price", "discount"]}
+    columns["revenue"] = sample["revenue"].round(2).tolist()
     payload = {
         "kpis": kpis,
-        "sample_rows": sample.to_dict(orient="records"),
+        "columns": {"day": sample["day"].dt.strftime("%Y-%m-%d").tolist(), **columns},
     }
-    return json.dumps(payload, ensure_ascii=False)
+    return _json_dumps(payload)
 
 
 def make_pdf_report(
@@ -181,13 +374,130 @@ def make_pdf_report(
     top_products_png: bytes,
     daily_rev_png: Optional[bytes],
     insights: Dict[str, Any],
+    use_platypus: bool = False,
+) -> bytes:
+    """Build a simple PDF with KPIs, charts, and insights using reportlab.
+
+    The fixed layout is drawn straight onto a canvas with a running y cursor,
+    skipping Platypus' frame layout engine. Pass use_platypus=True for the
+    flowable-based version, which reflows better for long reports.
+    """
+    if use_platypus:
+        return _make_pdf_report_platypus(kpis, top_products_png, daily_rev_png, insights)
+
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.lib.utils import ImageReader, simpleSplit
+    from reportlab.pdfgen import canvas
+
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=A4)
+    page_width, page_height = A4
+    left, margin = 18 * mm, 18 * mm
+    text_width = page_width - 2 * margin
+    y = page_height - margin
+
+    def ensure_space(needed: float) -> None:
+        nonlocal y
+        if y - needed < margin:
+            c.showPage()
+            y = page_height - margin
+
+    def heading(text: str, size: int = 14, space_before: float = 10, space_after: float = 6) -> None:
+        nonlocal y
+        ensure_space(space_before + size + 4 + space_after + 14)  # keep at least one body line with its heading
+        y -= space_before + size + 4
+        c.setFont("Helvetica", size)
+        c.drawString(left, y, text)
+        y -= space_after
+
+    def paragraph(text: str, size: int = 10, leading: float = 14) -> None:
+        nonlocal y
+        for line in simpleSplit(text, "Helvetica", size, text_width):
+            ensure_space(leading)
+            y -= leading
+            c.setFont("Helvetica", size)
+            c.drawString(left, y, line)
+
+    def image(png: bytes, width: float, height: float) -> None:
+        nonlocal y
+        ensure_space(height)
+        y -= height
+        c.drawImage(ImageReader(io.BytesIO(png)), left, y, width=width, height=height)
+
+    heading("AI Business Saathi — Executive Report", size=18, space_before=0, space_after=10)
+
+    # KPIs table
+    heading("Key Performance Indicators")
+    kpi_rows = [
+        ["Total Revenue", f"₹{kpis.get('total_revenue', 0):,.2f}"],
+        ["Total Orders", f"{kpis.get('total_orders', 0):,}"],
+        ["Avg Order Value", f"₹{kpis.get('avg_order_value', 0):,.2f}"],
+        ["Top Product", str(kpis.get('top_product') or '-')],
+        ["Top Category", str(kpis.get('top_category') or '-')],
+    ]
+    col_widths = [80 * mm, 60 * mm]
+    row_height = 18
+    ensure_space(row_height * len(kpi_rows))
+    c.setStrokeColor(colors.grey)
+    c.setLineWidth(0.25)
+    for i, row in enumerate(kpi_rows):
+        y -= row_height
+        x = left
+        for cell, cell_width in zip(row, col_widths):
+            if i == 0:
+                c.setFillColor(colors.whitesmoke)
+                c.rect(x, y, cell_width, row_height, stroke=0, fill=1)
+            c.rect(x, y, cell_width, row_height, stroke=1, fill=0)
+            c.setFillColor(colors.black)
+            c.setFont("Helvetica", 10)
+            c.drawString(x + 6, y + 6, cell)
+            x += cell_width
+    y -= 8
+
+    # Charts
+    heading("Top Products")
+    image(top_products_png, 160 * mm, 90 * mm)
+
+    if daily_rev_png:
+        y -= 6
+        heading("Revenue Trend")
+        image(daily_rev_png, 160 * mm, 80 * mm)
+
+    # Insights
+    y -= 8
+    heading("Executive Summary (EN)")
+    paragraph(str(insights.get("executive_summary_en", "-")))
+    y -= 4
+    heading("Executive Summary (HI)")
+    paragraph(str(insights.get("executive_summary_hi", "-")))
+
+    recos = insights.get("recommendations", []) or []
+    if recos:
+        y -= 6
+        heading("Top Recommendations")
+        for i, r in enumerate(recos[:3], start=1):
+            paragraph(f"{i}. {r}")
+
+    c.showPage()
+    c.save()
+    pdf = buf.getvalue()
+    buf.close()
+    return pdf
+
+
+def _make_pdf_report_platypus(
+    kpis: Dict[str, Any],
+    top_products_png: bytes,
+    daily_rev_png: Optional[bytes],
+    insights: Dict[str, Any],
 ) -> bytes:
-    """Build a simple PDF with KPIs, charts, and insights using reportlab."""
+    """Flowable-based layout of `make_pdf_report`."""
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import A4
     from reportlab.lib.styles import ParagraphStyle
     from reportlab.lib.units import mm
-    from reportlab.pdfgen import canvas
     from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
     buf = io.BytesIO()
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """Generate sample retail transaction data for demo purposes."""
 
-import csv
-import random
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
 # Sample products and categories
 PRODUCTS = [
     ("Coca Cola 500ml", "Beverages"),
@@ -27,55 +30,48 @@ PRODUCTS = [
 
 PAYMENT_METHODS = ["Cash", "Card", "UPI", "Wallet"]
 
-def generate_sample_data(num_days=7, transactions_per_day=20):
-    """Generate sample transaction data."""
-    data = []
+# Unit price range (low, high) per category
+PRICE_RANGES = {
+    "Beverages": (15, 50),
+    "Snacks": (10, 30),
+    "Food": (20, 150),
+    "Personal Care": (25, 100),
+    "Dairy": (30, 80),
+    "Vegetables": (15, 60),
+}
+DEFAULT_PRICE_RANGE = (10, 100)
+
+def generate_sample_data(num_days=7, transactions_per_day=20, seed=None):
+    """Generate sample transaction data as a DataFrame, one vectorised draw per column."""
+    rng = np.random.default_rng(seed)
     start_date = datetime.now() - timedelta(days=num_days-1)
+    dates = [start_date + timedelta(days=day) for day in range(num_days)]
     
-    for day in range(num_days):
-        current_date = start_date + timedelta(days=day)
-        
-        # More transactions on weekends
-        if current_date.weekday() >= 5:  # Weekend
-            num_transactions = int(transactions_per_day * 1.5)
-        else:
-            num_transactions = transactions_per_day
-            
-        for _ in range(num_transactions):
-            product, category = random.choice(PRODUCTS)
-            quantity = random.choices([1, 2, 3, 4, 5], weights=[50, 25, 15, 7, 3])[0]
-            
-            # Price ranges based on category
-            if category == "Beverages":
-                base_price = random.uniform(15, 50)
-            elif category == "Snacks":
-                base_price = random.uniform(10, 30)
-            elif category == "Food":
-                base_price = random.uniform(20, 150)
-            elif category == "Personal Care":
-                base_price = random.uniform(25, 100)
-            elif category == "Dairy":
-                base_price = random.uniform(30, 80)
-            elif category == "Vegetables":
-                base_price = random.uniform(15, 60)
-            else:
-                base_price = random.uniform(10, 100)
-            
-            unit_price = round(base_price, 2)
-            discount = random.choices([0, 5, 10, 15], weights=[70, 20, 8, 2])[0]
-            payment_method = random.choice(PAYMENT_METHODS)
-            
-            data.append({
-                "date": current_date.strftime("%Y-%m-%d"),
-                "product": product,
-                "category": category,
-                "quantity": quantity,
-                "unit_price": unit_price,
-                "discount": discount,
-                "payment_method": payment_method,
-            })
+    # More transactions on weekends
+    per_day = [
+        int(transactions_per_day * 1.5) if d.weekday() >= 5 else transactions_per_day
+        for d in dates
+    ]
+    n = sum(per_day)
     
-    return data
+    product_idx = rng.integers(len(PRODUCTS), size=n)
+    categories = [category for _, category in PRODUCTS]
+    low = np.array([PRICE_RANGES.get(c, DEFAULT_PRICE_RANGE)[0] for c in categories], dtype=float)
+    high = np.array([PRICE_RANGES.get(c, DEFAULT_PRICE_RANGE)[1] for c in categories], dtype=float)
+    
+    return pd.DataFrame({
+        "date": np.repeat([d.strftime("%Y-%m-%d") for d in dates], per_day),
+        "product": np.array([p for p, _ in PRODUCTS])[product_idx],
+        "category": np.array(categories)[product_idx],
+        "quantity": rng.choice([1, 2, 3, 4, 5], size=n, p=[0.50, 0.25, 0.15, 0.07, 0.03]),
+        "unit_price": rng.uniform(low[product_idx], high[product_idx]).round(2),
+        "discount": rng.choice([0, 5, 10, 15], size=n, p=[0.70, 0.20, 0.08, 0.02]),
+        "payment_method": rng.choice(PAYMENT_METHODS, size=n),
+    })
+
+def write_csv(df, path):
+    """Write a DataFrame with PyArrow's C++ CSV writer (string fields are quoted)."""
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
 
 def main():
     """Generate and save sample data."""
@@ -88,11 +84,7 @@ def main():
     
     # Save to CSV
     csv_path = sample_dir / "shop_sample.csv"
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        if data:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
+    write_csv(data, csv_path)
     
     print(f"Generated {len(data)} transactions in {csv_path}")
     
@@ -105,11 +97,7 @@ def main():
     
     for scenario_name, scenario_data in scenarios.items():
         scenario_path = sample_dir / f"demo_{scenario_name}.csv"
-        with open(scenario_path, 'w', newline='', encoding='utf-8') as f:
-            if scenario_data:
-                writer = csv.DictWriter(f, fieldnames=scenario_data[0].keys())
-                writer.writeheader()
-                writer.writerows(scenario_data)
+        write_csv(scenario_data, scenario_path)
         print(f"Generated {len(scenario_data)} transactions in {scenario_path}")
 
 if __name__ == "__main__":
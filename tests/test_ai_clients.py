@@ -0,0 +1,144 @@
+import gc
+import json
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.ai import client_factory
+from app.ai.client_factory import AIClient
+
+INSIGHTS = {"executive_summary_en": "ok"}
+
+
+class _ChatCompletionsHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for the OpenAI chat completions endpoint."""
+
+    protocol_version = "HTTP/1.1"
+    # Message content returned for every request
+    content = json.dumps(INSIGHTS)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "test",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": self.content},
+            }],
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    pytest.importorskip("openai")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_port}/v1")
+    monkeypatch.setattr(client_factory, "_CLIENT_REGISTRY", {})
+    AIClient.cache_clear()
+    yield _ChatCompletionsHandler
+    server.shutdown()
+    server.server_close()
+
+
+def test_openai_generate_many_twice(fake_openai):
+    # Each generate_many runs its own event loop; the async client must not outlive the first one
+    client = AIClient(provider="openai", api_key="sk-test")
+    assert client.generate_many(["a", "b"]) == [INSIGHTS, INSIGHTS]
+    assert client.generate_many(["c", "d"]) == [INSIGHTS, INSIGHTS]
+    # A new AIClient shares the registered provider client
+    assert AIClient(provider="openai", api_key="sk-test").generate_many(["e"]) == [INSIGHTS]
+
+
+def test_openai_generate_many_closes_its_connections(fake_openai):
+    client = AIClient(provider="openai", api_key="sk-test")
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        for _ in range(5):
+            client.generate_many(["a", "b", "c"])
+        gc.collect()
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+def test_openai_generate_many_from_concurrent_threads(fake_openai):
+    # Sessions share one registered provider client but each runs its own event loop
+    client = AIClient(provider="openai", api_key="sk-test")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda i: client.generate_many([f"p{i}-{j}" for j in range(4)]), range(8)))
+    assert results == [[INSIGHTS] * 4] * 8
+
+
+def test_openai_batch_returns_one_dict_per_prompt(fake_openai, monkeypatch):
+    client = AIClient(provider="openai", api_key="sk-test")
+    monkeypatch.setattr(fake_openai, "content", json.dumps({"results": [INSIGHTS, INSIGHTS]}))
+    assert client.generate_business_insights_batch(["a", "b"]) == [INSIGHTS, INSIGHTS]
+
+
+@pytest.mark.parametrize("results", [["x", "y"], [INSIGHTS, {}], [INSIGHTS]])
+def test_openai_batch_rejects_malformed_results(fake_openai, monkeypatch, results):
+    client = AIClient(provider="openai", api_key="sk-test")
+    monkeypatch.setattr(fake_openai, "content", json.dumps({"results": results}))
+    with pytest.raises(RuntimeError):
+        client.generate_business_insights_batch(["a", "b"])
+
+
+class _FakeGeminiModel:
+    class _Response:
+        def __init__(self, text):
+            part = type("Part", (), {"text": text})()
+            content = type("Content", (), {"parts": [part]})()
+            self.candidates = [type("Candidate", (), {"content": content})()]
+
+    def generate_content(self, prompt, generation_config=None):
+        return self._Response(json.dumps(INSIGHTS))
+
+
+def test_gemini_generate_many_twice(monkeypatch):
+    pytest.importorskip("google.generativeai")
+    monkeypatch.setattr(client_factory, "_CLIENT_REGISTRY", {})
+    client = AIClient(provider="gemini", api_key="gm-test")
+    monkeypatch.setattr(client._client, "_client", _FakeGeminiModel())
+    assert client.generate_many(["a", "b"]) == [INSIGHTS, INSIGHTS]
+    assert client.generate_many(["c", "d"]) == [INSIGHTS, INSIGHTS]
+
+
+def test_cached_insights_expire_after_ttl(monkeypatch):
+    calls = []
+
+    class _CountingProvider:
+        model = "test"
+
+        def generate_business_insights(self, prompt, temperature=0.2):
+            calls.append(prompt)
+            return dict(INSIGHTS)
+
+    now = [1000.0]
+    monkeypatch.setattr(client_factory.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(client_factory, "_CLIENT_REGISTRY", {})
+    AIClient.cache_clear()
+    client = AIClient(provider="gemini", api_key="", force_mock=True)
+    client._client = _CountingProvider()
+
+    assert client.generate_business_insights("same prompt") == INSIGHTS
+    assert client.generate_business_insights("same prompt") == INSIGHTS
+    assert len(calls) == 1
+
+    now[0] += client_factory._INSIGHTS_CACHE_TTL + 1
+    assert client.generate_business_insights("same prompt") == INSIGHTS
+    assert len(calls) == 2
+    AIClient.cache_clear()
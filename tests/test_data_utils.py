@@ -0,0 +1,122 @@
+import io
+
+import pandas as pd
+import pytest
+
+from app.utils import data_utils
+from app.utils.data_utils import (
+    build_json_for_ai,
+    compute_aggregates,
+    compute_kpis,
+    concat_transactions,
+    load_transactions_from_csv,
+    normalize_transactions,
+    stream_kpis,
+)
+
+
+def test_daily_revenue_keeps_local_day_for_offset_timestamps():
+    raw = pd.DataFrame({
+        "timestamp": ["2025-01-01T10:00+05:30", "2025-01-02T10:00+05:30", "2025-01-02T23:30+05:30"],
+        "product": ["Milk 1L", "Bread Loaf", "Milk 1L"],
+        "qty": [1, 2, 1],
+        "price": [10.0, 5.0, 4.0],
+    })
+    df = normalize_transactions(raw)
+
+    day_rev = compute_aggregates(df)["day_rev"]
+
+    assert [d.strftime("%Y-%m-%d") for d in day_rev.index] == ["2025-01-01", "2025-01-02"]
+    assert day_rev.tolist() == [10.0, 14.0]
+    # Same days as the AI payload
+    assert '"day":["2025-01-01","2025-01-02","2025-01-02"]' in build_json_for_ai(df, {})
+
+
+def test_daily_revenue_matches_groupby_for_naive_dates():
+    df = normalize_transactions(pd.DataFrame({
+        "date": ["2025-01-03", "2025-01-01", "2025-01-03"],
+        "product": ["a", "b", "c"],
+        "quantity": [1, 1, 2],
+        "unit_price": [3.0, 4.0, 5.0],
+    }))
+
+    expected = df.groupby("day")["revenue"].sum().sort_index()
+    pd.testing.assert_series_equal(compute_aggregates(df)["day_rev"], expected, check_names=False)
+
+
+@pytest.mark.parametrize("header", ["timestamp", "Order Date"])
+def test_pyarrow_reader_matches_pandas_reader(monkeypatch, header):
+    pytest.importorskip("pyarrow")
+    csv_bytes = (
+        f"{header},product,quantity,unit_price,category\r\n"
+        "2025-01-01T10:00+05:30,Milk 1L,1,10,Dairy\r\n"
+        "2025-01-02T01:00+05:30,Bread Loaf,2,5.5,\r\n"
+        "2025-01-02T23:30+05:30,Milk 1L,1,4,Dairy\r\n"
+    ).encode("utf-8")
+
+    monkeypatch.delenv("BUSSATHI_FAST_IO", raising=False)
+    expected = load_transactions_from_csv(csv_bytes)
+    monkeypatch.setattr(data_utils, "_read_csv_arrow", _fail_if_arrow_fails(data_utils._read_csv_arrow))
+    monkeypatch.setenv("BUSSATHI_FAST_IO", "1")
+    actual = load_transactions_from_csv(csv_bytes)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert compute_aggregates(actual)["day_rev"].to_dict() == {
+        pd.Timestamp("2025-01-01"): 10.0,
+        pd.Timestamp("2025-01-02"): 15.0,
+    }
+
+
+def _fail_if_arrow_fails(read_csv_arrow):
+    # The pyarrow reader returns None on failure and the pandas fallback would hide it
+    def wrapper(*args, **kwargs):
+        df = read_csv_arrow(*args, **kwargs)
+        assert df is not None
+        return df
+    return wrapper
+
+
+def test_stream_kpis_matches_full_frame():
+    csv_text = "date,product,quantity,unit_price,category\n" + "".join(
+        f"2025-01-{1 + i % 9:02d},P{i % 4},{1 + i % 3},{2.5 * (i % 5) + 1},C{i % 3}\n" for i in range(50)
+    )
+    full = load_transactions_from_csv(csv_text.encode("utf-8"))
+    agg = compute_aggregates(full)
+
+    steps = list(stream_kpis(io.StringIO(csv_text), chunksize=7))
+    kpis, day_rev, _ = steps[-1]
+
+    assert len(steps) == 8
+    assert sum(len(ch) for _, _, ch in steps) == len(full)
+    assert kpis == compute_kpis(agg)
+    pd.testing.assert_series_equal(day_rev, agg["day_rev"])
+
+
+def test_manual_entry_appends_to_upload_with_empty_optional_columns():
+    # Empty or numeric optional columns are read as float/int, manual entries are strings
+    uploaded = load_transactions_from_csv(
+        b"date,product,quantity,unit_price,category,payment_method\n"
+        b"2025-01-01,Milk 1L,1,10,,\n"
+        b"2025-01-02,Bread Loaf,2,5,,\n"
+    )
+    numeric = load_transactions_from_csv(
+        b"date,product,quantity,unit_price,category,payment_method\n2025-01-03,Eggs,1,6,7,1\n"
+    )
+    manual = normalize_transactions(pd.DataFrame([{
+        "date": pd.Timestamp("2025-01-04"),
+        "product": "Tea",
+        "quantity": 1,
+        "unit_price": 8.0,
+        "category": "Beverages",
+        "discount": 0.0,
+        "payment_method": "UPI",
+    }]))
+
+    df = concat_transactions([uploaded, numeric, manual])
+
+    assert list(df.columns) == list(manual.columns)
+    assert isinstance(df["category"].dtype, pd.CategoricalDtype)
+    assert df["category"].tolist()[2:] == [7, "Beverages"]
+    assert df["payment_method"].tolist()[2:] == [1, "UPI"]
+    assert df["category"].isna().tolist() == [True, True, False, False]
+    assert compute_aggregates(df)["cat_rev"].to_dict() == {"Beverages": 8.0, 7: 6.0}
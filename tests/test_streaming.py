@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from app.ai.streaming import TopLevelFieldParser, iter_partial_objects
+
+REPLY = {
+    "executive_summary_en": 'He said "stock up", then left \\ early',
+    "kpi_commentary": {"total_revenue": "up {10%}", "nested": {"days": [1, [2, 3]], "ok": True}},
+    "recommendations": ["Order milk, bread", "Promote [UPI] payments"],
+    "risks": [],
+    "score": 4.5,
+}
+
+
+def _feed_all(parser, chunks):
+    fields = {}
+    for chunk in chunks:
+        fields.update(parser.feed(chunk))
+    return fields
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_fields_survive_any_chunk_boundary(size):
+    # Small sizes split escape sequences, strings and nested brackets across chunks
+    text = json.dumps(REPLY)
+    chunks = [text[i:i + size] for i in range(0, len(text), size)]
+    assert _feed_all(TopLevelFieldParser(), chunks) == REPLY
+
+
+def test_escaped_quote_split_after_backslash():
+    parser = TopLevelFieldParser()
+    assert parser.feed('{"a": "x\\') == {}
+    assert parser.feed('"y", "b"') == {"a": 'x"y'}
+    assert parser.feed(": 1}") == {"b": 1}
+
+
+def test_nested_values_are_returned_only_when_closed():
+    parser = TopLevelFieldParser()
+    assert parser.feed('{"a": {"b": [1, 2') == {}
+    assert parser.feed('], "c": {}}, ') == {"a": {"b": [1, 2], "c": {}}}
+    assert parser.feed('"d": [[1], {"e": ","}]}') == {"d": [[1], {"e": ","}]}
+
+
+def test_preamble_and_trailing_text_are_ignored():
+    chunks = ["Sure! Here you go:\n```json\n", '{"a": 1, ', '"b": "}"}', "\n```\n{\"c\": 3}"]
+    assert _feed_all(TopLevelFieldParser(), chunks) == {"a": 1, "b": "}"}
+
+
+def test_invalid_member_is_skipped():
+    assert TopLevelFieldParser().feed('{"a": tru, "b": 2}') == {"b": 2}
+
+
+def test_iter_partial_objects_yields_growing_snapshots():
+    text = json.dumps({"a": 1, "b": [2], "c": "3"})
+    snapshots = list(iter_partial_objects(text[i:i + 4] for i in range(0, len(text), 4)))
+    assert snapshots == [{"a": 1}, {"a": 1, "b": [2]}, {"a": 1, "b": [2], "c": "3"}]